@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import cast
 
 from langchain_core.messages import HumanMessage
-from langchain_core.messages import merge_content
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import StreamWriter
 
@@ -23,7 +22,6 @@ from onyx.agents.agent_search.models import GraphConfig
 from onyx.agents.agent_search.shared_graph_utils.agent_prompt_ops import (
     build_history_prompt,
 )
-from onyx.agents.agent_search.shared_graph_utils.models import BaseMessage_Content
 from onyx.agents.agent_search.shared_graph_utils.models import LLMNodeErrorStrings
 from onyx.agents.agent_search.shared_graph_utils.utils import dispatch_separated
 from onyx.agents.agent_search.shared_graph_utils.utils import (
@@ -133,10 +131,10 @@ def decompose_orig_question(
 
     # dispatches custom events for subquestion tokens, adding in subquestion ids.
 
-    streamed_tokens: list[BaseMessage_Content] = []
+    decomposition_response = ""
 
     try:
-        streamed_tokens = run_with_timeout(
+        decomposition_response = run_with_timeout(
             AGENT_TIMEOUT_LLM_SUBQUESTION_GENERATION,
             dispatch_separated,
             model.stream(
@@ -148,9 +146,7 @@ def decompose_orig_question(
             sep_callback=dispatch_subquestion_sep(0, writer),
         )
 
-        decomposition_response = merge_content(*streamed_tokens)
-
-        list_of_subqs = cast(str, decomposition_response).split("\n")
+        list_of_subqs = decomposition_response.split("\n")
 
         initial_sub_questions = [sq.strip() for sq in list_of_subqs if sq.strip() != ""]
         log_result = f"decomposed original question into {len(initial_sub_questions)} subquestions"
@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import cast
 
 from langchain_core.messages import HumanMessage
-from langchain_core.messages import merge_content
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import StreamWriter
 
@@ -31,7 +30,6 @@ from onyx.agents.agent_search.shared_graph_utils.constants import (
     AgentLLMErrorType,
 )
 from onyx.agents.agent_search.shared_graph_utils.models import AgentErrorLog
-from onyx.agents.agent_search.shared_graph_utils.models import BaseMessage_Content
 from onyx.agents.agent_search.shared_graph_utils.models import LLMNodeErrorStrings
 from onyx.agents.agent_search.shared_graph_utils.utils import dispatch_separated
 from onyx.agents.agent_search.shared_graph_utils.utils import (
@@ -137,9 +135,9 @@ def create_refined_sub_questions(
     model = graph_config.tooling.fast_llm
 
     agent_error: AgentErrorLog | None = None
-    streamed_tokens: list[BaseMessage_Content] = []
+    streamed_response = ""
     try:
-        streamed_tokens = run_with_timeout(
+        streamed_response = run_with_timeout(
             AGENT_TIMEOUT_LLM_REFINED_SUBQUESTION_GENERATION,
             dispatch_separated,
             model.stream(
@@ -178,12 +176,7 @@ def create_refined_sub_questions(
         )
 
     else:
-        response = merge_content(*streamed_tokens)
-
-        if isinstance(response, str):
-            parsed_response = [q for q in response.split("\n") if q.strip() != ""]
-        else:
-            raise ValueError("LLM response is not a string")
+        parsed_response = [q for q in streamed_response.split("\n") if q.strip() != ""]
 
         refined_sub_question_dict = {}
         for sub_question_num, sub_question in enumerate(parsed_response):
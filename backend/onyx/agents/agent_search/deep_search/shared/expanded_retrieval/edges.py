@@ -27,6 +27,9 @@ def parallel_retrieval_edge(
 
     query_expansions = state.expanded_queries + [question]
 
+    # pull the loop-invariant state read out of the fan-out comprehension
+    sub_question_id = state.sub_question_id
+
     return [
         Send(
             "retrieve_documents",
@@ -34,7 +37,7 @@ def parallel_retrieval_edge(
                 query_to_retrieve=query,
                 question=question,
                 base_search=False,
-                sub_question_id=state.sub_question_id,
+                sub_question_id=sub_question_id,
                 log_messages=[],
             ),
         )
@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import cast
 
 from langchain_core.messages import HumanMessage
-from langchain_core.messages import merge_message_runs
 from langchain_core.runnables.config import RunnableConfig
 from langgraph.types import StreamWriter
 
@@ -26,7 +25,6 @@ from onyx.agents.agent_search.shared_graph_utils.constants import (
     AgentLLMErrorType,
 )
 from onyx.agents.agent_search.shared_graph_utils.models import AgentErrorLog
-from onyx.agents.agent_search.shared_graph_utils.models import BaseMessage_Content
 from onyx.agents.agent_search.shared_graph_utils.models import LLMNodeErrorStrings
 from onyx.agents.agent_search.shared_graph_utils.utils import dispatch_separated
 from onyx.agents.agent_search.shared_graph_utils.utils import (
@@ -73,11 +71,8 @@ def expand_queries(
     question = state.question
 
     model = graph_config.tooling.fast_llm
-    sub_question_id = state.sub_question_id
-    if sub_question_id is None:
-        level, question_num = 0, 0
-    else:
-        level, question_num = parse_question_id(sub_question_id)
+    # sub_question_id is None when this node runs on the original question
+    level, question_num = parse_question_id(state.sub_question_id or "0_0")
 
     msg = [
         HumanMessage(
@@ -86,12 +81,11 @@ def expand_queries(
     ]
 
     agent_error: AgentErrorLog | None = None
-    llm_response_list: list[BaseMessage_Content] = []
     llm_response = ""
     rewritten_queries = []
 
     try:
-        llm_response_list = run_with_timeout(
+        llm_response = run_with_timeout(
             AGENT_TIMEOUT_LLM_QUERY_REWRITING_GENERATION,
             dispatch_separated,
             model.stream(
@@ -101,10 +95,7 @@ def expand_queries(
             ),
             dispatch_subquery(level, question_num, writer),
         )
-        llm_response = merge_message_runs(llm_response_list, chunk_separator="")[
-            0
-        ].content
-        rewritten_queries = llm_response.split("\n")
+        rewritten_queries = llm_response.splitlines()
         log_result = f"Number of expanded queries: {len(rewritten_queries)}"
 
     except (LLMTimeoutError, TimeoutError):
@@ -34,20 +34,20 @@ def format_results(
     LangGraph node that constructs the proper expanded retrieval format.
     """
     level, question_num = parse_question_id(state.sub_question_id or "0_0")
-    query_info = get_query_info(state.query_retrieval_results)
+    query_retrieval_results = state.query_retrieval_results
+    query_info = get_query_info(query_retrieval_results)
 
     graph_config = cast(GraphConfig, config["metadata"]["config"])
 
     # Main question docs will be sent later after aggregation and deduping with sub-question docs
-    reranked_documents = state.reranked_documents
+    context_documents = state.reranked_documents
+    reranked_documents = context_documents
 
     if not (level == 0 and question_num == 0):
         if len(reranked_documents) == 0:
             # The sub-question is used as the last query. If no verified documents are found, stream
             # the top 3 for that one. We may want to revisit this.
-            reranked_documents = state.query_retrieval_results[-1].retrieved_documents[
-                :3
-            ]
+            reranked_documents = query_retrieval_results[-1].retrieved_documents[:3]
 
         assert (
             graph_config.tooling.search_tool
@@ -74,7 +74,7 @@ def format_results(
             )
     sub_question_retrieval_stats = calculate_sub_question_retrieval_stats(
         verified_documents=state.verified_documents,
-        expanded_retrieval_results=state.query_retrieval_results,
+        expanded_retrieval_results=query_retrieval_results,
     )
 
     if sub_question_retrieval_stats is None:
@@ -82,10 +82,10 @@ def format_results(
 
     return ExpandedRetrievalUpdate(
         expanded_retrieval_result=QuestionRetrievalResult(
-            expanded_query_results=state.query_retrieval_results,
+            expanded_query_results=query_retrieval_results,
             retrieved_documents=state.retrieved_documents,
             verified_reranked_documents=reranked_documents,
-            context_documents=state.reranked_documents,
+            context_documents=context_documents,
             retrieval_stats=sub_question_retrieval_stats,
         ),
     )
@@ -11,35 +11,65 @@ from onyx.agents.agent_search.deep_search.shared.expanded_retrieval.states impor
     ExpandedRetrievalState,
 )
 from onyx.configs.agent_configs import AGENT_MAX_VERIFICATION_HITS
+from onyx.configs.agent_configs import AGENT_VERIFICATION_MIN_SCORE
+from onyx.context.search.models import InferenceSection
 
 
 def kickoff_verification(
     state: ExpandedRetrievalState,
     config: RunnableConfig,
-) -> Command[Literal["verify_documents"]]:
+) -> Command[Literal["verify_documents", "rerank_documents"]]:
     """
     LangGraph node (Command node!) that kicks off the verification process for the retrieved documents.
-    Note that this is a Command node and does the routing as well. (At present, no state updates
-    are done here, so this could be replaced with an edge. But we may choose to make state
-    updates later.)
+    Documents whose document id has already been verified for this question are passed through as
+    verified without another LLM call, and documents scoring below AGENT_VERIFICATION_MIN_SCORE
+    are rejected outright. The remaining documents are handed to a single verification node,
+    which batches them into LLM calls and runs those calls concurrently. Note that this is a
+    Command node and does the routing as well.
     """
     retrieved_documents = state.retrieved_documents[:AGENT_MAX_VERIFICATION_HITS]
     verification_question = state.question
 
+    already_verified_doc_ids = {
+        document.center_chunk.document_id for document in state.verified_documents
+    }
+
+    trivially_verified_documents: list[InferenceSection] = []
+    documents_to_verify: list[InferenceSection] = []
+    for document in retrieved_documents:
+        center_chunk = document.center_chunk
+        if center_chunk.document_id in already_verified_doc_ids:
+            # another section of this document was already verified for the
+            # same question, so the LLM check can be skipped
+            trivially_verified_documents.append(document)
+        elif (
+            center_chunk.score is not None
+            and center_chunk.score < AGENT_VERIFICATION_MIN_SCORE
+        ):
+            # reject without an LLM call, the retrieval score is too low
+            continue
+        else:
+            documents_to_verify.append(document)
+
+    if not documents_to_verify:
+        return Command(
+            update={"verified_documents": trivially_verified_documents},
+            goto="rerank_documents",
+        )
+
     sub_question_id = state.sub_question_id
     return Command(
-        update={},
+        update={"verified_documents": trivially_verified_documents},
         goto=[
             Send(
                 node="verify_documents",
                 arg=DocVerificationInput(
-                    retrieved_document_to_verify=document,
+                    retrieved_documents_to_verify=documents_to_verify,
                     question=verification_question,
                     base_search=False,
                     sub_question_id=sub_question_id,
                     log_messages=[],
                 ),
             )
-            for document in retrieved_documents
         ],
     )
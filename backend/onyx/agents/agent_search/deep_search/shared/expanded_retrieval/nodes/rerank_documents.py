@@ -1,4 +1,5 @@
 from datetime import datetime
+from itertools import islice
 from typing import cast
 
 from langchain_core.runnables.config import RunnableConfig
@@ -57,11 +58,16 @@ def rerank_documents(
     rerank_settings = graph_config.inputs.search_request.rerank_settings
     allow_agent_reranking = graph_config.behavior.allow_agent_reranking
 
+    if rerank_settings is None:
+        rerank_settings = graph_config.behavior.cached_fallback_rerank_settings
+
     if rerank_settings is None:
         with get_session_context_manager() as db_session:
             search_settings = get_current_search_settings(db_session)
             if not search_settings.disable_rerank_for_streaming:
                 rerank_settings = RerankingDetails.from_db_model(search_settings)
+                # cache for the other sub-question reranks of this graph run
+                graph_config.behavior.cached_fallback_rerank_settings = rerank_settings
 
     # Initial default: no reranking. Will be overwritten below if reranking is warranted
     reranked_documents = verified_documents
@@ -94,9 +100,17 @@ def rerank_documents(
         fit_scores = RetrievalFitStats(fit_score_lift=0, rerank_effect=0, fit_scores={})
 
     return DocRerankingUpdate(
-        reranked_documents=[
-            doc for doc in reranked_documents if type(doc) == InferenceSection
-        ][:AGENT_RERANKING_MAX_QUERY_RETRIEVAL_RESULTS],
+        # islice stops the filtering as soon as enough documents are collected
+        reranked_documents=list(
+            islice(
+                (
+                    doc
+                    for doc in reranked_documents
+                    if isinstance(doc, InferenceSection)
+                ),
+                AGENT_RERANKING_MAX_QUERY_RETRIEVAL_RESULTS,
+            )
+        ),
         sub_question_retrieval_stats=fit_scores,
         log_messages=[
             get_langgraph_node_log_string(
@@ -65,6 +65,7 @@ def retrieve_documents(
         raise ValueError("search_tool must be provided for agentic search")
 
     callback_container: list[list[InferenceSection]] = []
+    summary_response: SearchResponseSummary | None = None
 
     # new db session to avoid concurrency issues
     with get_session_context_manager() as db_session:
@@ -77,17 +78,20 @@ def retrieve_documents(
                 skip_query_analysis=not state.base_search,
             ),
         ):
-            # get retrieved docs to send to the rest of the graph
+            # only the summary response is needed; capture it and stop iterating
+            # so that the db session is released before any further processing
             if tool_response.id == SEARCH_RESPONSE_SUMMARY_ID:
-                response = cast(SearchResponseSummary, tool_response.response)
-                retrieved_docs = response.top_sections
-                query_info = SearchQueryInfo(
-                    predicted_search=response.predicted_search,
-                    final_filters=response.final_filters,
-                    recency_bias_multiplier=response.recency_bias_multiplier,
-                )
+                summary_response = cast(SearchResponseSummary, tool_response.response)
                 break
 
+    if summary_response is not None:
+        retrieved_docs = summary_response.top_sections
+        query_info = SearchQueryInfo(
+            predicted_search=summary_response.predicted_search,
+            final_filters=summary_response.final_filters,
+            recency_bias_multiplier=summary_response.recency_bias_multiplier,
+        )
+
     retrieved_docs = retrieved_docs[:AGENT_MAX_QUERY_RETRIEVAL_RESULTS]
 
     if AGENT_RETRIEVAL_STATS:
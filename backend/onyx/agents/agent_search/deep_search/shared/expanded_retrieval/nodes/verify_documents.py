@@ -1,3 +1,7 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import cast
 
@@ -12,98 +16,171 @@ from onyx.agents.agent_search.deep_search.shared.expanded_retrieval.states impor
     DocVerificationUpdate,
 )
 from onyx.agents.agent_search.models import GraphConfig
-from onyx.agents.agent_search.shared_graph_utils.agent_prompt_ops import (
-    binary_string_test,
-)
 from onyx.agents.agent_search.shared_graph_utils.agent_prompt_ops import (
     trim_prompt_piece,
 )
-from onyx.agents.agent_search.shared_graph_utils.constants import (
-    AGENT_POSITIVE_VALUE_STR,
-)
 from onyx.agents.agent_search.shared_graph_utils.models import LLMNodeErrorStrings
 from onyx.agents.agent_search.shared_graph_utils.utils import (
     get_langgraph_node_log_string,
 )
-from onyx.configs.agent_configs import AGENT_MAX_TOKENS_VALIDATION
-from onyx.configs.agent_configs import AGENT_TIMEOUT_CONNECT_LLM_DOCUMENT_VERIFICATION
+from onyx.configs.agent_configs import AGENT_MAX_TOKENS_VALIDATION_PER_DOC
 from onyx.configs.agent_configs import AGENT_TIMEOUT_LLM_DOCUMENT_VERIFICATION
+from onyx.configs.agent_configs import AGENT_VERIFICATION_BATCH_SIZE
+from onyx.configs.agent_configs import AGENT_VERIFICATION_CONCURRENCY
+from onyx.context.search.models import InferenceSection
 from onyx.llm.chat_llm import LLMRateLimitError
 from onyx.llm.chat_llm import LLMTimeoutError
+from onyx.llm.interfaces import LLM
 from onyx.prompts.agent_search import (
-    DOCUMENT_VERIFICATION_PROMPT,
+    DOCUMENT_VERIFICATION_BATCH_PROMPT,
 )
 from onyx.utils.logger import setup_logger
-from onyx.utils.threadpool_concurrency import run_with_timeout
+from onyx.utils.threadpool_concurrency import run_functions_tuples_in_parallel
 from onyx.utils.timing import log_function_time
 
 logger = setup_logger()
 
 _llm_node_error_strings = LLMNodeErrorStrings(
-    timeout="The LLM timed out. The document could not be verified. The document will be treated as 'relevant'",
-    rate_limit="The LLM encountered a rate limit. The document could not be verified. The document will be treated as 'relevant'",
-    general_error="The LLM encountered an error. The document could not be verified. The document will be treated as 'relevant'",
+    timeout="The LLM timed out. The documents could not be verified. "
+    "The documents will be treated as 'relevant'",
+    rate_limit="The LLM encountered a rate limit. The documents could not be verified. "
+    "The documents will be treated as 'relevant'",
+    general_error="The LLM encountered an error. The documents could not be verified. "
+    "The documents will be treated as 'relevant'",
 )
 
+# Bounded LRU cache of verification results keyed by hashed (question, document
+# content). Sub-question overlap and retries re-verify the same pairs, which
+# would otherwise pay a redundant LLM prefill.
+_VERIFICATION_CACHE_MAX_SIZE = 4096
+_verification_cache: OrderedDict[tuple[bytes, bytes], bool] = OrderedDict()
+_verification_cache_lock = threading.Lock()
 
-@log_function_time(print_only=True)
-def verify_documents(
-    state: DocVerificationInput, config: RunnableConfig
-) -> DocVerificationUpdate:
-    """
-    LangGraph node to check whether the document is relevant for the original user question
 
-    Args:
-        state (DocVerificationInput): The current state
-        config (RunnableConfig): Configuration containing AgentSearchConfig
+def _verification_cache_key(
+    question: str, document_content: str
+) -> tuple[bytes, bytes]:
+    # blake2b is faster than sha256 for these short inputs and collisions are
+    # a non-issue at a 16 byte digest
+    return (
+        hashlib.blake2b(question.encode(), digest_size=16).digest(),
+        hashlib.blake2b(document_content.encode(), digest_size=16).digest(),
+    )
 
-    Updates:
-        verified_documents: list[InferenceSection]
+
+def _get_cached_verification_result(
+    question: str, document_content: str
+) -> bool | None:
+    key = _verification_cache_key(question, document_content)
+    with _verification_cache_lock:
+        if key not in _verification_cache:
+            return None
+        _verification_cache.move_to_end(key)
+        return _verification_cache[key]
+
+
+def _cache_verification_result(
+    question: str, document_content: str, verified: bool
+) -> None:
+    key = _verification_cache_key(question, document_content)
+    with _verification_cache_lock:
+        _verification_cache[key] = verified
+        _verification_cache.move_to_end(key)
+        while len(_verification_cache) > _VERIFICATION_CACHE_MAX_SIZE:
+            _verification_cache.popitem(last=False)
+
+
+def _parse_verification_response(response_content: str) -> dict[int, bool] | None:
+    """
+    Parse the JSON array of per-document verification objects out of the LLM response.
+    Returns a mapping of document id to verification result, or None if no valid
+    JSON array could be extracted.
     """
+    array_start = response_content.find("[")
+    array_end = response_content.rfind("]")
+    if array_start == -1 or array_end == -1:
+        logger.warning("No JSON array found in document verification response")
+        return None
 
-    node_start_time = datetime.now()
+    try:
+        parsed_results = json.loads(response_content[array_start : array_end + 1])
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse document verification response as JSON")
+        return None
 
-    question = state.question
-    retrieved_document_to_verify = state.retrieved_document_to_verify
-    document_content = retrieved_document_to_verify.combined_content
+    verification_results: dict[int, bool] = {}
+    for result in parsed_results:
+        if not isinstance(result, dict) or not isinstance(result.get("id"), int):
+            continue
+        verified = result.get("verified")
+        # only accept proper booleans - coercing e.g. a quoted "false" with
+        # bool() would mark the document as verified; anything else is
+        # treated as missing instead
+        if isinstance(verified, bool):
+            verification_results[result["id"]] = verified
+
+    return verification_results
 
-    graph_config = cast(GraphConfig, config["metadata"]["config"])
-    fast_llm = graph_config.tooling.fast_llm
 
-    document_content = trim_prompt_piece(
-        config=fast_llm.config,
-        prompt_piece=document_content,
-        reserved_str=DOCUMENT_VERIFICATION_PROMPT + question,
+def _verify_document_batch(
+    documents_to_verify: list[InferenceSection],
+    question: str,
+    fast_llm: LLM,
+) -> list[InferenceSection]:
+    """
+    Verify one batch of documents with a single LLM call that asks for a
+    per-document yes/no decision, amortizing the shared question prefill
+    across the batch.
+    """
+    document_list = "\n".join(
+        '<doc id="{}">\n{}\n</doc>'.format(
+            doc_num,
+            trim_prompt_piece(
+                config=fast_llm.config,
+                prompt_piece=document.combined_content,
+                reserved_str=DOCUMENT_VERIFICATION_BATCH_PROMPT + question,
+                num_pieces=len(documents_to_verify),
+            ),
+        )
+        for doc_num, document in enumerate(documents_to_verify)
     )
 
     msg = [
         HumanMessage(
-            content=DOCUMENT_VERIFICATION_PROMPT.format(
-                question=question, document_content=document_content
+            content=DOCUMENT_VERIFICATION_BATCH_PROMPT.format(
+                question=question, document_list=document_list
             )
         )
     ]
 
     response: BaseMessage | None = None
 
-    verified_documents = [
-        retrieved_document_to_verify
-    ]  # default is to treat document as relevant
+    # default is to treat all documents in the batch as relevant
+    verified_documents = list(documents_to_verify)
 
     try:
-        response = run_with_timeout(
-            AGENT_TIMEOUT_LLM_DOCUMENT_VERIFICATION,
-            fast_llm.invoke,
+        # the LLM client enforces the timeout itself, so no extra watchdog
+        # thread is spawned per batch on top of the batch worker threads
+        response = fast_llm.invoke(
             prompt=msg,
-            timeout_override=AGENT_TIMEOUT_CONNECT_LLM_DOCUMENT_VERIFICATION,
-            max_tokens=AGENT_MAX_TOKENS_VALIDATION,
+            timeout_override=AGENT_TIMEOUT_LLM_DOCUMENT_VERIFICATION,
+            max_tokens=AGENT_MAX_TOKENS_VALIDATION_PER_DOC * len(documents_to_verify),
         )
 
         assert isinstance(response.content, str)
-        if not binary_string_test(
-            text=response.content, positive_value=AGENT_POSITIVE_VALUE_STR
-        ):
+        verification_results = _parse_verification_response(response.content)
+        if verification_results is not None:
             verified_documents = []
+            for doc_num, document in enumerate(documents_to_verify):
+                doc_verified = verification_results.get(doc_num)
+                if doc_verified is not None:
+                    _cache_verification_result(
+                        question, document.combined_content, doc_verified
+                    )
+                # documents missing from the response are treated as relevant,
+                # but their (unknown) result is not cached
+                if doc_verified is None or doc_verified:
+                    verified_documents.append(document)
 
     except (LLMTimeoutError, TimeoutError):
         # In this case, we decide to continue and don't raise an error, as
@@ -115,6 +192,67 @@ def verify_documents(
         # little harm in letting some docs through that are less relevant.
         logger.error("LLM Rate Limit Error - verify documents")
 
+    return verified_documents
+
+
+@log_function_time(print_only=True)
+def verify_documents(
+    state: DocVerificationInput, config: RunnableConfig
+) -> DocVerificationUpdate:
+    """
+    LangGraph node to check whether the retrieved documents are relevant for the original
+    user question. The documents are split into batches of AGENT_VERIFICATION_BATCH_SIZE,
+    and the batch LLM calls run concurrently (capped at AGENT_VERIFICATION_CONCURRENCY)
+    so the backend can batch them instead of seeing one-by-one round-trips.
+
+    Args:
+        state (DocVerificationInput): The current state
+        config (RunnableConfig): Configuration containing AgentSearchConfig
+
+    Updates:
+        verified_documents: list[InferenceSection]
+    """
+
+    node_start_time = datetime.now()
+
+    question = state.question
+    documents_to_verify = state.retrieved_documents_to_verify
+
+    graph_config = cast(GraphConfig, config["metadata"]["config"])
+    fast_llm = graph_config.tooling.fast_llm
+
+    # serve documents with a cached verification result without an LLM call;
+    # cached rejections are dropped outright
+    verified_documents: list[InferenceSection] = []
+    uncached_documents: list[InferenceSection] = []
+    for document in documents_to_verify:
+        cached_result = _get_cached_verification_result(
+            question, document.combined_content
+        )
+        if cached_result is None:
+            uncached_documents.append(document)
+        elif cached_result:
+            verified_documents.append(document)
+
+    document_batches = [
+        uncached_documents[batch_start : batch_start + AGENT_VERIFICATION_BATCH_SIZE]
+        for batch_start in range(
+            0, len(uncached_documents), AGENT_VERIFICATION_BATCH_SIZE
+        )
+    ]
+
+    batch_results = run_functions_tuples_in_parallel(
+        [
+            (_verify_document_batch, (document_batch, question, fast_llm))
+            for document_batch in document_batches
+        ],
+        max_workers=AGENT_VERIFICATION_CONCURRENCY,
+    )
+
+    verified_documents.extend(
+        document for batch_result in batch_results for document in batch_result
+    )
+
     return DocVerificationUpdate(
         verified_documents=verified_documents,
         log_messages=[
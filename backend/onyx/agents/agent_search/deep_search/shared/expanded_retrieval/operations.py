@@ -1,7 +1,5 @@
-from collections import defaultdict
 from collections.abc import Callable
 
-import numpy as np
 from langgraph.types import StreamWriter
 
 from onyx.agents.agent_search.shared_graph_utils.models import AgentChunkRetrievalStats
@@ -32,62 +30,106 @@ def dispatch_subquery(
     return helper
 
 
+def _aggregate_chunk_stats(
+    chunk_scores: dict[tuple[str, int], list[float]],
+    verified_doc_chunk_keys: frozenset[tuple[str, int]],
+) -> tuple[int, int, float, float, list[tuple[str, int]]]:
+    """
+    Hot aggregation loop over the per-chunk scores: returns the verified and
+    rejected counts, the corresponding score sums, and the dismissed
+    (document id, chunk id) keys, computed in a single pass.
+    """
+    verified_count = 0
+    rejected_count = 0
+    verified_score_sum = 0.0
+    rejected_score_sum = 0.0
+    dismissed_doc_chunk_keys: list[tuple[str, int]] = []
+
+    for doc_chunk_key, chunk_score_list in chunk_scores.items():
+        # scores are filtered for None at insertion, so they can be averaged directly
+        chunk_avg_score = sum(chunk_score_list) / len(chunk_score_list)
+
+        if doc_chunk_key in verified_doc_chunk_keys:
+            verified_count += 1
+            verified_score_sum += chunk_avg_score
+        else:
+            rejected_count += 1
+            rejected_score_sum += chunk_avg_score
+            dismissed_doc_chunk_keys.append(doc_chunk_key)
+
+    return (
+        verified_count,
+        rejected_count,
+        verified_score_sum,
+        rejected_score_sum,
+        dismissed_doc_chunk_keys,
+    )
+
+
 def calculate_sub_question_retrieval_stats(
     verified_documents: list[InferenceSection],
     expanded_retrieval_results: list[QueryRetrievalResult],
 ) -> AgentChunkRetrievalStats:
-    chunk_scores: dict[str, dict[str, list[int | float]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-
+    # keyed by (document id, chunk id) tuples - hashing the tuple is cheaper
+    # than building an interpolated string id per chunk; the string form is
+    # only produced once for the stats output below
+    chunk_scores: dict[tuple[str, int], list[float]] = {}
+
+    # flatten the nested result objects into parallel lists up front so the
+    # aggregation below works on plain values instead of re-walking pydantic
+    # attribute chains per access
+    doc_ids: list[str] = []
+    chunk_ids: list[int] = []
+    scores: list[float | None] = []
     for expanded_retrieval_result in expanded_retrieval_results:
         for doc in expanded_retrieval_result.retrieved_documents:
-            doc_chunk_id = f"{doc.center_chunk.document_id}_{doc.center_chunk.chunk_id}"
-            if doc.center_chunk.score is not None:
-                chunk_scores[doc_chunk_id]["score"].append(doc.center_chunk.score)
-
-    verified_doc_chunk_ids = [
-        f"{verified_document.center_chunk.document_id}_{verified_document.center_chunk.chunk_id}"
+            center_chunk = doc.center_chunk
+            doc_ids.append(center_chunk.document_id)
+            chunk_ids.append(center_chunk.chunk_id)
+            scores.append(center_chunk.score)
+
+    for doc_id, chunk_id, score in zip(doc_ids, chunk_ids, scores):
+        if score is not None:
+            chunk_scores.setdefault((doc_id, chunk_id), []).append(score)
+
+    verified_doc_chunk_keys = [
+        (
+            verified_document.center_chunk.document_id,
+            verified_document.center_chunk.chunk_id,
+        )
         for verified_document in verified_documents
     ]
-    dismissed_doc_chunk_ids = []
 
-    raw_chunk_stats_counts: dict[str, int] = defaultdict(int)
-    raw_chunk_stats_scores: dict[str, float] = defaultdict(float)
-    for doc_chunk_id, chunk_data in chunk_scores.items():
-        valid_chunk_scores = [
-            score for score in chunk_data["score"] if score is not None
-        ]
-        key = "verified" if doc_chunk_id in verified_doc_chunk_ids else "rejected"
-        raw_chunk_stats_counts[f"{key}_count"] += 1
+    # frozenset for O(1) membership tests in the aggregation
+    (
+        verified_count,
+        rejected_count,
+        verified_score_sum,
+        rejected_score_sum,
+        dismissed_doc_chunk_keys,
+    ) = _aggregate_chunk_stats(chunk_scores, frozenset(verified_doc_chunk_keys))
 
-        raw_chunk_stats_scores[f"{key}_scores"] += float(np.mean(valid_chunk_scores))
-
-        if key == "rejected":
-            dismissed_doc_chunk_ids.append(doc_chunk_id)
-
-    if raw_chunk_stats_counts["verified_count"] == 0:
+    if verified_count == 0:
         verified_avg_scores = 0.0
     else:
-        verified_avg_scores = raw_chunk_stats_scores["verified_scores"] / float(
-            raw_chunk_stats_counts["verified_count"]
-        )
+        verified_avg_scores = verified_score_sum / float(verified_count)
 
-    rejected_scores = raw_chunk_stats_scores.get("rejected_scores")
-    if rejected_scores is not None:
-        rejected_avg_scores = rejected_scores / float(
-            raw_chunk_stats_counts["rejected_count"]
-        )
-    else:
+    if rejected_count == 0:
         rejected_avg_scores = None
+    else:
+        rejected_avg_scores = rejected_score_sum / float(rejected_count)
 
     chunk_stats = AgentChunkRetrievalStats(
-        verified_count=raw_chunk_stats_counts["verified_count"],
+        verified_count=verified_count,
         verified_avg_scores=verified_avg_scores,
-        rejected_count=raw_chunk_stats_counts["rejected_count"],
+        rejected_count=rejected_count,
         rejected_avg_scores=rejected_avg_scores,
-        verified_doc_chunk_ids=verified_doc_chunk_ids,
-        dismissed_doc_chunk_ids=dismissed_doc_chunk_ids,
+        verified_doc_chunk_ids=[
+            f"{doc_id}_{chunk_id}" for doc_id, chunk_id in verified_doc_chunk_keys
+        ],
+        dismissed_doc_chunk_ids=[
+            f"{doc_id}_{chunk_id}" for doc_id, chunk_id in dismissed_doc_chunk_keys
+        ],
     )
 
     return chunk_stats
@@ -88,7 +88,7 @@ class ExpandedRetrievalState(
 
 
 class DocVerificationInput(ExpandedRetrievalInput):
-    retrieved_document_to_verify: InferenceSection
+    retrieved_documents_to_verify: list[InferenceSection]
 
 
 class RetrievalInput(ExpandedRetrievalInput):
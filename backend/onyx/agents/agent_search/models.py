@@ -5,6 +5,7 @@ from pydantic import model_validator
 from sqlalchemy.orm import Session
 
 from onyx.chat.prompt_builder.answer_prompt_builder import AnswerPromptBuilder
+from onyx.context.search.models import RerankingDetails
 from onyx.context.search.models import SearchRequest
 from onyx.file_store.utils import InMemoryChatFile
 from onyx.llm.interfaces import LLM
@@ -69,6 +70,11 @@ class GraphSearchConfig(BaseModel):
     skip_gen_ai_answer_generation: bool = False
     allow_agent_reranking: bool = False
 
+    # Fallback rerank settings resolved from the current search settings the
+    # first time they are needed; cached here so the sub-question reranks of
+    # one graph run do not each redo the DB lookup
+    cached_fallback_rerank_settings: RerankingDetails | None = None
+
 
 class GraphConfig(BaseModel):
     """
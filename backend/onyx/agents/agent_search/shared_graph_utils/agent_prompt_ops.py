@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 from langchain.schema import AIMessage
 from langchain.schema import HumanMessage
 from langchain.schema import SystemMessage
@@ -59,10 +62,15 @@ def build_sub_question_answer_prompt(
     return [system_message, human_message]
 
 
-def trim_prompt_piece(config: LLMConfig, prompt_piece: str, reserved_str: str) -> str:
+def trim_prompt_piece(
+    config: LLMConfig, prompt_piece: str, reserved_str: str, num_pieces: int = 1
+) -> str:
+    # num_pieces > 1 splits the available budget evenly across the pieces that
+    # will share the prompt (e.g. batched document verification)
+
     # no need to trim if a conservative estimate of one token
     # per character is already less than the max tokens
-    if len(prompt_piece) + len(reserved_str) < config.max_input_tokens:
+    if len(prompt_piece) * num_pieces + len(reserved_str) < config.max_input_tokens:
         return prompt_piece
 
     llm_tokenizer = get_tokenizer(
@@ -73,8 +81,10 @@ def trim_prompt_piece(config: LLMConfig, prompt_piece: str, reserved_str: str) -
     # slightly conservative trimming
     return tokenizer_trim_content(
         content=prompt_piece,
-        desired_length=config.max_input_tokens
-        - len(llm_tokenizer.encode(reserved_str)),
+        desired_length=(
+            config.max_input_tokens - len(llm_tokenizer.encode(reserved_str))
+        )
+        // num_pieces,
         tokenizer=llm_tokenizer,
     )
 
@@ -141,6 +151,13 @@ def get_prompt_enrichment_components(
     )
 
 
+@lru_cache(maxsize=8)
+def _positive_value_pattern(positive_value: str) -> re.Pattern[str]:
+    # Compiled once per positive value so the hot yes/no checks scan the
+    # response directly instead of lower-casing a copy of it each call
+    return re.compile(re.escape(positive_value), re.IGNORECASE)
+
+
 def binary_string_test(text: str, positive_value: str = "yes") -> bool:
     """
     Tests if a string contains a positive value (case-insensitive).
@@ -152,7 +169,7 @@ def binary_string_test(text: str, positive_value: str = "yes") -> bool:
     Returns:
         True if the positive value is found in the text
     """
-    return positive_value.lower() in text.lower()
+    return _positive_value_pattern(positive_value).search(text) is not None
 
 
 def binary_string_test_after_answer_separator(
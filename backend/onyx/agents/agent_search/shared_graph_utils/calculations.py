@@ -18,16 +18,22 @@ def unique_chunk_id(doc: InferenceSection) -> str:
 
 
 def calculate_rank_shift(list1: list, list2: list, top_n: int = 20) -> float:
-    shift = 0
-    for rank_first, doc_id in enumerate(list1[:top_n], 1):
-        try:
-            rank_second = list2.index(doc_id) + 1
-        except ValueError:
-            rank_second = len(list2)  # Document not found in second list
+    ranks_by_doc_id = {doc_id: rank for rank, doc_id in enumerate(list2, 1)}
+
+    considered_docs = list1[:top_n]
+    first_ranks = np.arange(1, len(considered_docs) + 1)
+    # documents not found in the second list get the worst possible rank
+    second_ranks = np.fromiter(
+        (ranks_by_doc_id.get(doc_id, len(list2)) for doc_id in considered_docs),
+        dtype=np.int64,
+        count=len(considered_docs),
+    )
 
-        shift += np.abs(rank_first - rank_second) / np.log(1 + rank_first * rank_second)
+    shift = np.sum(
+        np.abs(first_ranks - second_ranks) / np.log(1 + first_ranks * second_ranks)
+    )
 
-    return shift / top_n
+    return float(shift) / top_n
 
 
 def get_fit_scores(
@@ -58,17 +64,28 @@ def get_fit_scores(
     for rank_type, docs in ranked_sections.items():
         logger.debug(f"rank_type: {rank_type}")
 
+        # stage the scores into an array once so that the top-k averages are
+        # computed as vector ops instead of repeated per-doc Python loops
+        sections = [doc for doc in docs if type(doc) == InferenceSection]
+        section_scores = np.fromiter(
+            (
+                (
+                    float(doc.center_chunk.score)
+                    if doc.center_chunk.score is not None
+                    else 0.0
+                )
+                for doc in sections
+            ),
+            dtype=np.float32,
+            count=len(sections),
+        )
+        cumulative_scores = np.cumsum(section_scores)
+
         for i in [1, 5, 10]:
             fit_eval.fit_scores[rank_type].scores[str(i)] = (
-                sum(
-                    [
-                        float(doc.center_chunk.score)
-                        for doc in docs[:i]
-                        if type(doc) == InferenceSection
-                        and doc.center_chunk.score is not None
-                    ]
-                )
-                / i
+                float(cumulative_scores[min(i, len(cumulative_scores)) - 1]) / i
+                if len(cumulative_scores) > 0
+                else 0.0
             )
 
         fit_eval.fit_scores[rank_type].scores["fit_score"] = (
@@ -86,7 +103,7 @@ def get_fit_scores(
         ].scores["1"]
 
         fit_eval.fit_scores[rank_type].chunk_ids = [
-            unique_chunk_id(doc) for doc in docs if type(doc) == InferenceSection
+            unique_chunk_id(doc) for doc in sections
         ]
 
     fit_eval.fit_score_lift = (
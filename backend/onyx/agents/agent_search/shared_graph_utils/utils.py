@@ -20,7 +20,6 @@ from onyx.agents.agent_search.models import GraphInputs
 from onyx.agents.agent_search.models import GraphPersistence
 from onyx.agents.agent_search.models import GraphSearchConfig
 from onyx.agents.agent_search.models import GraphTooling
-from onyx.agents.agent_search.shared_graph_utils.models import BaseMessage_Content
 from onyx.agents.agent_search.shared_graph_utils.models import (
     EntityRelationshipTermExtraction,
 )
@@ -319,13 +318,17 @@ def dispatch_separated(
     dispatch_event: Callable[[str, int], None],
     sep_callback: Callable[[int], None] | None = None,
     sep: str = DISPATCH_SEP_CHAR,
-) -> list[BaseMessage_Content]:
+) -> str:
+    """
+    Dispatch the stream via the given callback and return the accumulated
+    response content, folded together as the tokens arrive instead of
+    materializing the chunk list for a separate merge pass.
+    """
     num = 1
-    accumulated_tokens = ""
-    streamed_tokens: list[BaseMessage_Content] = []
+    accumulated_content = ""
     for token in tokens:
-        accumulated_tokens += cast(str, token.content)
         content = cast(str, token.content)
+        accumulated_content += content
         if sep in content:
             sub_question_parts = content.split(sep)
             _dispatch_nonempty(sub_question_parts[0], dispatch_event, num)
@@ -339,12 +342,11 @@ def dispatch_separated(
             )
         else:
             _dispatch_nonempty(content, dispatch_event, num)
-        streamed_tokens.append(content)
 
     if sep_callback:
         sep_callback(num)
 
-    return streamed_tokens
+    return accumulated_content
 
 
 def dispatch_main_answer_stop_info(level: int, writer: StreamWriter) -> None:
@@ -45,6 +45,28 @@ AGENT_MAX_VERIFICATION_HITS = int(
     os.environ.get("AGENT_MAX_VERIFICATION_HITS") or AGENT_DEFAULT_MAX_VERIFIVATION_HITS
 )  # 30
 
+AGENT_DEFAULT_VERIFICATION_BATCH_SIZE = 8
+# number of documents that are verified in a single LLM call
+AGENT_VERIFICATION_BATCH_SIZE = int(
+    os.environ.get("AGENT_VERIFICATION_BATCH_SIZE")
+    or AGENT_DEFAULT_VERIFICATION_BATCH_SIZE
+)  # 8
+
+AGENT_DEFAULT_VERIFICATION_CONCURRENCY = 8
+# maximum number of verification LLM calls that are in flight at once
+AGENT_VERIFICATION_CONCURRENCY = int(
+    os.environ.get("AGENT_VERIFICATION_CONCURRENCY")
+    or AGENT_DEFAULT_VERIFICATION_CONCURRENCY
+)  # 8
+
+AGENT_DEFAULT_VERIFICATION_MIN_SCORE = 0.0
+# documents with retrieval scores below this threshold are rejected
+# without an LLM verification call
+AGENT_VERIFICATION_MIN_SCORE = float(
+    os.environ.get("AGENT_VERIFICATION_MIN_SCORE")
+    or AGENT_DEFAULT_VERIFICATION_MIN_SCORE
+)  # 0.0
+
 AGENT_MAX_QUERY_RETRIEVAL_RESULTS = int(
     os.environ.get("AGENT_MAX_QUERY_RETRIEVAL_RESULTS") or AGENT_DEFAULT_RETRIEVAL_HITS
 )  # 15
@@ -343,6 +365,12 @@ AGENT_MAX_TOKENS_VALIDATION = int(
     os.environ.get("AGENT_MAX_TOKENS_VALIDATION") or AGENT_DEFAULT_MAX_TOKENS_VALIDATION
 )
 
+AGENT_DEFAULT_MAX_TOKENS_VALIDATION_PER_DOC = 16
+AGENT_MAX_TOKENS_VALIDATION_PER_DOC = int(
+    os.environ.get("AGENT_MAX_TOKENS_VALIDATION_PER_DOC")
+    or AGENT_DEFAULT_MAX_TOKENS_VALIDATION_PER_DOC
+)
+
 AGENT_DEFAULT_MAX_TOKENS_SUBANSWER_GENERATION = 256
 AGENT_MAX_TOKENS_SUBANSWER_GENERATION = int(
     os.environ.get("AGENT_MAX_TOKENS_SUBANSWER_GENERATION")
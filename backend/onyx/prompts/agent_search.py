@@ -478,19 +478,52 @@ is asked about the psychology of football, one could be tempted to use the docum
 psychology in sports. However, it is NOT about football and should not be deemed relevant. Please \
 consider this logic.
 
+QUESTION:
+{SEPARATOR_LINE}
+{{question}}
+{SEPARATOR_LINE}
+
+Do you think that the following document text is useful and relevant to answer the question above?
+
 DOCUMENT TEXT:
 {SEPARATOR_LINE}
 {{document_content}}
 {SEPARATOR_LINE}
 
-Do you think that this document text is useful and relevant to answer the following question?
+Please answer with exactly and only a '{YES}' or '{NO}'. Do NOT include any other text in your response:
+
+Answer:
+""".strip()
+
+
+DOCUMENT_VERIFICATION_BATCH_PROMPT = f"""
+Determine for each of the following document texts whether it contains data or information that is \
+potentially relevant for a question. A document does not have to be fully relevant, but check whether \
+it has some information that would help - possibly in conjunction with other documents - to address \
+the question.
+
+Be careful that you do not use a document where you are not sure whether the text applies to the objects \
+or entities that are relevant for the question. For example, a book about chess could have long passage \
+discussing the psychology of chess without - within the passage - mentioning chess. If now a question \
+is asked about the psychology of football, one could be tempted to use the document as it does discuss \
+psychology in sports. However, it is NOT about football and should not be deemed relevant. Please \
+consider this logic.
 
 QUESTION:
 {SEPARATOR_LINE}
 {{question}}
 {SEPARATOR_LINE}
 
-Please answer with exactly and only a '{YES}' or '{NO}'. Do NOT include any other text in your response:
+Do you think that the individual document texts below are useful and relevant to answer the question above?
+
+DOCUMENT TEXTS:
+{SEPARATOR_LINE}
+{{document_list}}
+{SEPARATOR_LINE}
+
+Please answer with exactly and only a JSON array that contains one object per document, matching the \
+document ids above, like [{{{{"id": 0, "verified": true}}}}, {{{{"id": 1, "verified": false}}}}, ...]. \
+Do NOT include any other text in your response:
 
 Answer:
 """.strip()
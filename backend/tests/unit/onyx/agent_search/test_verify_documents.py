@@ -0,0 +1,52 @@
+import pytest
+
+from onyx.agents.agent_search.deep_search.shared.expanded_retrieval.nodes.verify_documents import (
+    _parse_verification_response,
+)
+
+
+def test_parse_verification_response_happy_path() -> None:
+    response = '[{"id": 0, "verified": true}, {"id": 1, "verified": false}]'
+    assert _parse_verification_response(response) == {0: True, 1: False}
+
+
+def test_parse_verification_response_with_surrounding_text() -> None:
+    response = (
+        'Here are the results:\n[{"id": 0, "verified": true}]\nLet me know if '
+        "you need anything else."
+    )
+    assert _parse_verification_response(response) == {0: True}
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        "",
+        "yes",
+        '{"id": 0, "verified": true}',
+    ],
+)
+def test_parse_verification_response_no_array(response: str) -> None:
+    assert _parse_verification_response(response) is None
+
+
+def test_parse_verification_response_invalid_json() -> None:
+    assert _parse_verification_response('[{"id": 0, "verified": tru') is None
+
+
+def test_parse_verification_response_skips_non_dict_entries() -> None:
+    response = '[0, "verified", {"id": 1, "verified": true}]'
+    assert _parse_verification_response(response) == {1: True}
+
+
+def test_parse_verification_response_skips_missing_or_non_int_ids() -> None:
+    response = '[{"verified": true}, {"id": "0", "verified": true}, {"id": 1, "verified": false}]'
+    assert _parse_verification_response(response) == {1: False}
+
+
+def test_parse_verification_response_treats_non_bool_verified_as_missing() -> None:
+    # a quoted "false" must not be coerced into a verified result
+    response = (
+        '[{"id": 0, "verified": "false"}, {"id": 1}, {"id": 2, "verified": true}]'
+    )
+    assert _parse_verification_response(response) == {2: True}